@@ -4,4 +4,5 @@ mssql_conn = (
 )
 
 OVR_PICKUP_PATH = "../data/ovr_data"
-OVR_BATCH_SIZE = 300
\ No newline at end of file
+OVR_BATCH_SIZE = 300
+OVR_MAX_WORKERS = 1
\ No newline at end of file
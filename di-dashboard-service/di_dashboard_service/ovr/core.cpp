@@ -3,7 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_string_dtype
 
 
 @dataclass(frozen=True)
@@ -37,29 +39,59 @@ DEFAULT_TARGET_ORDER: List[str] = [
 ]
 
 
+def _repair_utf8(x):
+    return x.encode("utf-8", errors="replace").decode("utf-8") if isinstance(x, str) else x
+
+
+def _normalize_series(series: pd.Series) -> pd.Series:
+    # dtype-level check: object columns qualify whatever their null content
+    if not is_string_dtype(series.dtype):
+        return series
+    values = series.to_numpy(dtype=object)
+    try:
+        # valid text round-trips unchanged, so one C-level encode of the whole
+        # column proves there is nothing to repair
+        "".join(values[pd.notna(values)].tolist()).encode("utf-8")
+        return series
+    except (TypeError, UnicodeEncodeError):
+        # mixed types or lone surrogates: repair cell by cell
+        return series.map(_repair_utf8)
+
+
 def normalize_strings(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
     if not columns:
         return df
     for col in columns:
         if col in df.columns:
-            df[col] = df[col].apply(
-                lambda x: x.encode("utf-8").decode("utf-8") if isinstance(x, str) else x
-            )
+            df[col] = _normalize_series(df[col])
     return df
 
 
+def _coalesce_logins(
+    owner: Optional[pd.Series],
+    modifier: Optional[pd.Series],
+    accessor: Optional[pd.Series],
+    index: pd.Index,
+) -> pd.Series:
+    # single pass over the underlying arrays instead of chained fillna copies
+    missing = np.full(len(index), None, dtype=object)
+    o = missing if owner is None else owner.to_numpy(dtype=object)
+    m = missing if modifier is None else modifier.to_numpy(dtype=object)
+    a = missing if accessor is None else accessor.to_numpy(dtype=object)
+    result = np.where(pd.isna(o), np.where(pd.isna(m), a, m), o)
+    return pd.Series(result, index=index, copy=False)
+
+
 def compute_ownership(df: pd.DataFrame) -> pd.Series:
-    owner = df.get("Owner_Login")
-    modifier = df.get("Modifier_Login")
-    accessor = df.get("Accessor_Login")
-    # fillna chains work only on Series, ensure defaults exist
-    if owner is None:
-        owner = pd.Series([None] * len(df), index=df.index)
-    if modifier is None:
-        modifier = pd.Series([None] * len(df), index=df.index)
-    if accessor is None:
-        accessor = pd.Series([None] * len(df), index=df.index)
-    return owner.fillna(modifier).fillna(accessor)
+    return _coalesce_logins(
+        df.get("Owner_Login"), df.get("Modifier_Login"), df.get("Accessor_Login"), df.index
+    )
+
+
+def _constant_column(value: str, index: pd.Index) -> pd.Series:
+    # one category plus int8 codes instead of the same string object on every row
+    codes = np.zeros(len(index), dtype=np.int8)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=[value]), index=index, copy=False)
 
 
 def transform_chunk(
@@ -75,20 +107,34 @@ def transform_chunk(
     - Computes Ownership
     - Adds Load_For and Inferred_Owner_Level
     - Reorders columns according to mapping.target_order (or default)
-    """
-    renamed = chunk.rename(columns=mapping.source_to_target)
 
-    renamed = normalize_strings(renamed, mapping.string_columns or [])
-
-    renamed["Ownership"] = compute_ownership(renamed)
-
-    renamed["Load_For"] = load_for_value
-    if "Inferred_Owner_Level" not in renamed.columns:
-        renamed["Inferred_Owner_Level"] = ""
+    The output frame is assembled once from column references instead of
+    renaming, mutating and reindexing the chunk step by step, so passed-through
+    columns share memory with `chunk`. Constant columns (Load_For, defaulted
+    targets) are categorical.
+    """
+    string_columns = set(mapping.string_columns or [])
+    columns: Dict[str, pd.Series] = {}
+    for source in chunk.columns:
+        target = mapping.source_to_target.get(source, source)
+        col = chunk[source]
+        columns[target] = _normalize_series(col) if target in string_columns else col
+
+    columns["Ownership"] = _coalesce_logins(
+        columns.get("Owner_Login"),
+        columns.get("Modifier_Login"),
+        columns.get("Accessor_Login"),
+        chunk.index,
+    )
 
     target_order = mapping.target_order or DEFAULT_TARGET_ORDER
-    available = [c for c in target_order if c in renamed.columns]
-    missing = [c for c in target_order if c not in renamed.columns]
-    for m in missing:
-        renamed[m] = ""
-    return renamed[target_order]
+    out = {}
+    for c in target_order:
+        if c == "Load_For":
+            out[c] = _constant_column(load_for_value, chunk.index)
+        elif c in columns:
+            out[c] = columns[c]
+        else:
+            # missing targets (incl. Inferred_Owner_Level) default to ""
+            out[c] = _constant_column("", chunk.index)
+    return pd.DataFrame(out, index=chunk.index, columns=target_order, copy=False)
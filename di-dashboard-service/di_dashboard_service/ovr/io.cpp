@@ -17,12 +17,17 @@ class CSVReadOptions:
 
 
 def iter_zip_files(pickup_dir: str) -> Generator[str, None, None]:
-    """Yield absolute paths of .zip files in pickup_dir."""
+    """Yield absolute paths of .zip files in pickup_dir, skipping hidden files."""
     if not os.path.isdir(pickup_dir):
         return
-    for name in sorted(os.listdir(pickup_dir)):
-        if name.lower().endswith(".zip"):
-            yield os.path.join(pickup_dir, name)
+    # DirEntry caches the file type from readdir, so no per-entry stat()
+    with os.scandir(pickup_dir) as it:
+        zips = sorted(
+            e.path
+            for e in it
+            if e.name.lower().endswith(".zip") and not e.name.startswith(".") and e.is_file()
+        )
+    yield from zips
 
 
 def iter_csv_members(zippath: str) -> Generator[str, None, None]:
@@ -43,13 +48,14 @@ def iter_csv_chunks_from_zip(
     Never extracts entire zip or whole CSV into memory.
     """
     opts = read_opts or CSVReadOptions()
+    usecols = list(opts.usecols) if opts.usecols is not None else None
     with zipfile.ZipFile(zippath, mode="r") as zf:
         with zf.open(member, mode="r") as bf:
             text_stream = io.TextIOWrapper(bf, encoding=opts.encoding, newline="")
             reader = pd.read_csv(
                 text_stream,
                 chunksize=opts.chunksize,
-                usecols=list(opts.usecols) if opts.usecols is not None else None,
+                usecols=usecols,
             )
             for chunk in reader:  # type: ignore
                 yield chunk
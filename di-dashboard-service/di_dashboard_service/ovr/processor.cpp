@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Callable, Iterable, Optional
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Union
 
 import pandas as pd
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine, make_url
 from sqlalchemy.types import NVARCHAR, BigInteger
 
 
@@ -21,6 +23,7 @@ except Exception:  # pragma: no cover
         env = "DEV"
         OVR_PICKUP_PATH = "./ovr_pickup"
         OVR_BATCH_SIZE = 500_000
+        OVR_MAX_WORKERS = 1
     config = _Cfg()  # type: ignore
 
 from .core import ColumnMapping, transform_chunk, DEFAULT_TARGET_ORDER
@@ -33,6 +36,12 @@ logger = logging.getLogger(__name__)
 class DBOptions:
     table_name: str = "DIRaw"
     chunksize: int = 5_000
+    # MSSQL only, opt-in: stage each zip in this session temp table (e.g. "#diraw_stage")
+    # and move it with one INSERT ... SELECT. DIRaw's clustered PK makes that insert
+    # fully logged, so it only pays off for per-zip atomicity. Keep the name lower
+    # case: pandas re-lists the catalog after each insert into a mixed-case table,
+    # and session temp tables never show up there
+    stage_table_name: Optional[str] = None
 
 
 SQL_DTYPE = {
@@ -60,7 +69,12 @@ SQL_DTYPE = {
 
 
 def default_engine_factory() -> Engine:
-    return create_engine(f"{config.mssql_conn}")
+    url = make_url(f"{config.mssql_conn}")
+    kwargs = {}
+    # pyodbc sends executemany() as one bound array instead of a round-trip per row
+    if url.get_backend_name() == "mssql" and url.get_driver_name() == "pyodbc":
+        kwargs["fast_executemany"] = True
+    return create_engine(url, **kwargs)
 
 
 class OVRProcessor:
@@ -72,6 +86,7 @@ class OVRProcessor:
         csv_batch_rows: Optional[int] = None,
         db_options: Optional[DBOptions] = None,
         load_for_value: str = "OVR",
+        max_workers: Optional[int] = None,
     ) -> None:
         self.mapping = mapping
         self.engine_factory = engine_factory
@@ -79,59 +94,177 @@ class OVRProcessor:
         self.csv_batch_rows = csv_batch_rows or getattr(config, "OVR_BATCH_SIZE", 500_000)
         self.db_options = db_options or DBOptions()
         self.load_for_value = load_for_value
+        # >1 fans zips out to worker processes; keep within the DB's concurrent load budget
+        if max_workers is None:
+            max_workers = getattr(config, "OVR_MAX_WORKERS", 1)
+        self.max_workers = max_workers
         self.rows_written: int = 0
+        self._source_columns_tuple = tuple(mapping.source_to_target.keys())
+        self._engine: Optional[Engine] = None
 
     def process_all(self) -> int:
         """Process all .zip files found in pickup path.
         Returns number of processed zip files."""
-        processed = 0
-        seen_any_zip = False
-        for zippath in iter_zip_files(self.pickup_path):
-            seen_any_zip = True
-            try:
-                self._process_zip(zippath)
-                processed += 1
-                logger.info(f"Processed OVR zip: {zippath}")
-            except Exception as e:  # log and continue to next zip
-                logger.exception(f"Failed processing zip {zippath}: {e}")
-        if not seen_any_zip:
+        zippaths = list(iter_zip_files(self.pickup_path))
+        if not zippaths:
             logger.error(f"No .zip files found in pickup path: {self.pickup_path}")
             return 0
+        if self.max_workers > 1 and len(zippaths) > 1:
+            settings = self._worker_settings()
+            if settings is not None:
+                return self._process_all_parallel(zippaths, settings)
+
+        processed = 0
+        try:
+            for zippath in zippaths:
+                try:
+                    self._process_zip(zippath)
+                    processed += 1
+                    logger.info(f"Processed OVR zip: {zippath}")
+                except Exception as e:  # log and continue to next zip
+                    logger.exception(f"Failed processing zip {zippath}: {e}")
+        finally:
+            self._dispose_engine()
+        return processed
+
+    def _worker_settings(self) -> Optional[Dict[str, Any]]:
+        """OVRProcessor kwargs for worker processes, or None if they can't be pickled
+        (e.g. a lambda or closure engine_factory)."""
+        settings = dict(
+            mapping=self.mapping,
+            engine_factory=self.engine_factory,
+            pickup_path=self.pickup_path,
+            csv_batch_rows=self.csv_batch_rows,
+            db_options=self.db_options,
+            load_for_value=self.load_for_value,
+            max_workers=1,
+        )
+        try:
+            pickle.dumps(settings)
+        except Exception as e:
+            logger.warning(
+                f"Processor settings are not picklable, processing zips sequentially: {e}"
+            )
+            return None
+        return settings
+
+    def _process_all_parallel(self, zippaths: List[str], settings: Dict[str, Any]) -> int:
+        """Process zips in worker processes, each with its own engine."""
+        processed = 0
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(zippaths))) as ex:
+            futures = {ex.submit(_process_zip_worker, settings, zp): zp for zp in zippaths}
+            for future in as_completed(futures):
+                zippath = futures[future]
+                try:
+                    self.rows_written += future.result()
+                    processed += 1
+                    logger.info(f"Processed OVR zip: {zippath}")
+                except Exception as e:  # log and continue to next zip
+                    logger.exception(f"Failed processing zip {zippath}: {e}")
         return processed
 
     def _process_zip(self, zippath: str) -> None:
         read_opts = CSVReadOptions(chunksize=self.csv_batch_rows, usecols=self._source_columns())
+        engine = self._get_engine()
+        if not self._use_staging(engine):
+            for chunk in self._iter_zip_chunks(zippath, read_opts):
+                self.rows_written += self._process_chunk(chunk, engine, self.db_options.table_name)
+            return
+
+        # MSSQL: land the whole zip in a session temp table, then move it into the
+        # target with one set-based INSERT ... SELECT in the same transaction
+        stage = self.db_options.stage_table_name
+        staged = 0
+        with engine.begin() as conn:
+            self._drop_stage(conn)
+            for chunk in self._iter_zip_chunks(zippath, read_opts):
+                staged += self._process_chunk(chunk, conn, stage)
+            if staged:
+                self._flush_stage(conn)
+                self._drop_stage(conn)
+        self.rows_written += staged
+
+    def _iter_zip_chunks(
+        self, zippath: str, read_opts: CSVReadOptions
+    ) -> Generator[pd.DataFrame, None, None]:
         found_member = False
         for member in iter_csv_members(zippath):
             found_member = True
             found_rows = False
             for chunk in iter_csv_chunks_from_zip(zippath, member, read_opts):
                 found_rows = True
-                self._process_chunk(chunk)
+                yield chunk
             if not found_rows:
                 logger.error(f"CSV member has no rows: zip={zippath}, member={member}")
         if not found_member:
             logger.error(f"No CSV files found inside zip: {zippath}")
 
+    def _use_staging(self, engine: Engine) -> bool:
+        return bool(self.db_options.stage_table_name) and engine.dialect.name == "mssql"
+
+    def _drop_stage(self, conn: Connection) -> None:
+        stage = self.db_options.stage_table_name
+        # temp tables live as long as the pooled connection, not the transaction
+        conn.exec_driver_sql(
+            f"IF OBJECT_ID('tempdb..{stage}') IS NOT NULL "
+            f"DROP TABLE {conn.dialect.identifier_preparer.quote(stage)}"
+        )
+
+    def _flush_stage(self, conn: Connection) -> None:
+        quote = conn.dialect.identifier_preparer.quote
+        target_order = self.mapping.target_order or DEFAULT_TARGET_ORDER
+        cols = ", ".join(quote(c) for c in target_order)
+        conn.exec_driver_sql(
+            f"INSERT INTO {quote(self.db_options.table_name)} ({cols}) "
+            f"SELECT {cols} FROM {quote(self.db_options.stage_table_name)}"
+        )
+
+    def _get_engine(self) -> Engine:
+        """Create the engine on first use and reuse it (and its pool) for every chunk."""
+        if self._engine is None:
+            self._engine = self.engine_factory()
+        return self._engine
+
+    def _dispose_engine(self) -> None:
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
     def _source_columns(self) -> Optional[Iterable[str]]:
-        return list(self.mapping.source_to_target.keys())
+        return self._source_columns_tuple
 
-    def _process_chunk(self, chunk: pd.DataFrame) -> None:
+    def _process_chunk(
+        self,
+        chunk: pd.DataFrame,
+        con: Union[Engine, Connection],
+        table_name: str,
+    ) -> int:
+        """Transform and append one chunk to table_name. Returns rows written."""
         transformed = transform_chunk(chunk, self.mapping, load_for_value=self.load_for_value)
-        engine = self.engine_factory()
         row_count = len(transformed)
         if row_count == 0:
             logger.error("Transformed chunk is empty; skipping write")
-            return
+            return 0
         transformed.to_sql(
-            self.db_options.table_name,
-            engine,
+            table_name,
+            con,
             if_exists="append",
             index=False,
             dtype=SQL_DTYPE,
             chunksize=self.db_options.chunksize,
         )
-        self.rows_written += row_count
+        return row_count
+
+
+def _process_zip_worker(settings: Dict[str, Any], zippath: str) -> int:
+    """ProcessPoolExecutor entry point; must stay module-level to be picklable.
+    Returns rows written for the zip."""
+    processor = OVRProcessor(**settings)
+    try:
+        processor._process_zip(zippath)
+    finally:
+        processor._dispose_engine()
+    return processor.rows_written
 
 
 DEFAULT_MAPPING = ColumnMapping(
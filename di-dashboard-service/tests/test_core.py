@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from sqlalchemy import create_engine
+
+from di_dashboard_service.ovr.core import (
+    DEFAULT_TARGET_ORDER,
+    _normalize_series,
+    normalize_strings,
+    transform_chunk,
+)
+from di_dashboard_service.ovr.io import CSVReadOptions, iter_csv_chunks_from_zip, iter_csv_members
+from di_dashboard_service.ovr.processor import DEFAULT_MAPPING, SQL_DTYPE
+
+SAMPLE_ZIP = next((Path(__file__).resolve().parents[2] / "data" / "ovr_data").glob("*.zip"))
+
+
+def test_valid_text_returns_same_series():
+    series = pd.Series(["a", "ü", "日本"])
+    assert _normalize_series(series) is series
+
+
+def test_nulls_are_kept():
+    series = pd.Series(["a", None, np.nan])
+    out = _normalize_series(series)
+    assert out is series
+    assert out[0] == "a" and out[1] is None and np.isnan(out[2])
+
+
+def test_lone_surrogate_is_replaced_even_with_nulls():
+    out = _normalize_series(pd.Series(["a\udcff", None]))
+    assert out.tolist() == ["a?", None]
+
+
+def test_mixed_str_int_column_keeps_non_strings():
+    out = _normalize_series(pd.Series([1, "a\udcff", None, "b"], dtype=object))
+    assert out.tolist() == [1, "a?", None, "b"]
+
+
+def test_non_string_columns_are_skipped():
+    df = pd.DataFrame({"n": [1, 2], "s": ["x\udcff", "y"]})
+    out = normalize_strings(df, ["n", "s", "absent"])
+    assert out["n"].dtype == np.int64
+    assert out["s"].tolist() == ["x?", "y"]
+
+
+def _reference_transform(chunk: pd.DataFrame, load_for_value: str = "OVR") -> pd.DataFrame:
+    """The original rename / fillna / reindex implementation, kept as an oracle."""
+    renamed = chunk.rename(columns=DEFAULT_MAPPING.source_to_target)
+    missing = pd.Series([None] * len(renamed), index=renamed.index)
+    owner = renamed.get("Owner_Login", missing)
+    modifier = renamed.get("Modifier_Login", missing)
+    accessor = renamed.get("Accessor_Login", missing)
+    renamed["Ownership"] = owner.fillna(modifier).fillna(accessor)
+    renamed["Load_For"] = load_for_value
+    for c in DEFAULT_TARGET_ORDER:
+        if c not in renamed.columns:
+            renamed[c] = ""
+    return renamed[DEFAULT_TARGET_ORDER]
+
+
+def _decategorize(df: pd.DataFrame) -> pd.DataFrame:
+    categorical = [c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)]
+    return df.astype({c: object for c in categorical})
+
+
+def _sample_chunks():
+    opts = CSVReadOptions(chunksize=300, usecols=tuple(DEFAULT_MAPPING.source_to_target))
+    for member in iter_csv_members(str(SAMPLE_ZIP)):
+        yield from iter_csv_chunks_from_zip(str(SAMPLE_ZIP), member, opts)
+
+
+def test_transform_matches_reference_on_sample_zip():
+    chunks = list(_sample_chunks())
+    assert chunks
+    for chunk in chunks:
+        out = transform_chunk(chunk, DEFAULT_MAPPING)
+        assert list(out.columns) == DEFAULT_TARGET_ORDER
+        assert_frame_equal(_decategorize(out), _reference_transform(chunk.copy()))
+
+
+def test_ownership_with_missing_and_all_nan_logins():
+    chunk = pd.DataFrame(
+        {
+            "Path_ID": [1, 2, 3],
+            "Owner_Login": [np.nan, np.nan, np.nan],
+            "Accessor_Login": ["a1", None, "a3"],
+        }
+    )
+    out = transform_chunk(chunk, DEFAULT_MAPPING)
+    assert out["Ownership"][0] == "a1"
+    assert pd.isna(out["Ownership"][1])
+    assert out["Ownership"][2] == "a3"
+    assert (out["Modifier_Login"] == "").all()
+    assert_frame_equal(_decategorize(out), _reference_transform(chunk.copy()), check_dtype=False)
+
+
+def test_ownership_with_no_login_columns():
+    out = transform_chunk(pd.DataFrame({"Path_ID": [1, 2]}), DEFAULT_MAPPING)
+    assert out["Ownership"].isna().all()
+    assert (out["Owner_Login"] == "").all()
+
+
+def test_constant_columns_are_categorical_and_round_trip_through_to_sql(tmp_path):
+    chunk = next(_sample_chunks())
+    out = transform_chunk(chunk, DEFAULT_MAPPING, load_for_value="OVR")
+    for col, value in (("Load_For", "OVR"), ("Inferred_Owner_Level", "")):
+        assert isinstance(out[col].dtype, pd.CategoricalDtype)
+        assert list(out[col].cat.categories) == [value]
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ovr.db'}")
+    out.to_sql("DIRaw", engine, index=False, dtype=SQL_DTYPE)
+    back = pd.read_sql_table("DIRaw", engine)
+    engine.dispose()
+    assert back["Load_For"].tolist() == ["OVR"] * len(out)
+    assert back["Inferred_Owner_Level"].tolist() == [""] * len(out)
@@ -0,0 +1,157 @@
+import shutil
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import mssql, sqlite
+
+from di_dashboard_service.ovr.processor import (
+    DBOptions,
+    DEFAULT_MAPPING,
+    SQL_DTYPE,
+    OVRProcessor,
+)
+
+SAMPLE_ZIP = next((Path(__file__).resolve().parents[2] / "data" / "ovr_data").glob("*.zip"))
+
+
+class RecordingConnection:
+    def __init__(self) -> None:
+        self.dialect = mssql.dialect()
+        self.statements = []
+
+    def exec_driver_sql(self, sql: str) -> None:
+        self.statements.append(sql)
+
+
+class RecordingEngine:
+    def __init__(self, dialect) -> None:
+        self.dialect = dialect
+        self.conn = RecordingConnection()
+        self.disposed = False
+
+    @contextmanager
+    def begin(self):
+        yield self.conn
+
+    def dispose(self) -> None:
+        self.disposed = True
+
+
+STAGED = DBOptions(stage_table_name="#diraw_stage")
+
+
+def _processor(engine, db_options=STAGED) -> OVRProcessor:
+    return OVRProcessor(DEFAULT_MAPPING, engine_factory=lambda: engine, db_options=db_options)
+
+
+def test_staging_is_opt_in_and_mssql_only():
+    processor = _processor(None)
+    assert processor._use_staging(SimpleNamespace(dialect=mssql.dialect()))
+    assert not processor._use_staging(SimpleNamespace(dialect=sqlite.dialect()))
+
+    default = _processor(None, DBOptions())
+    assert not default._use_staging(SimpleNamespace(dialect=mssql.dialect()))
+
+
+def test_drop_stage_sql():
+    conn = RecordingConnection()
+    _processor(None)._drop_stage(conn)
+    assert conn.statements == [
+        "IF OBJECT_ID('tempdb..#diraw_stage') IS NOT NULL DROP TABLE [#diraw_stage]"
+    ]
+
+
+def test_flush_stage_sql():
+    conn = RecordingConnection()
+    _processor(None)._flush_stage(conn)
+    quote = conn.dialect.identifier_preparer.quote
+    cols = ", ".join(quote(c) for c in DEFAULT_MAPPING.target_order)
+    assert conn.statements == [f"INSERT INTO [DIRaw] ({cols}) SELECT {cols} FROM [#diraw_stage]"]
+
+
+def test_process_zip_stages_in_one_transaction():
+    engine = RecordingEngine(mssql.dialect())
+    processor = _processor(engine)
+    written = []
+    processor._iter_zip_chunks = lambda zippath, read_opts: iter([[1, 2], [3]])
+
+    def fake_chunk(chunk, con, table_name):
+        written.append((con, table_name))
+        return len(chunk)
+
+    processor._process_chunk = fake_chunk
+    processor._process_zip("ovr.zip")
+
+    assert written == [(engine.conn, "#diraw_stage")] * 2
+    drop, insert, drop_again = engine.conn.statements
+    assert drop == drop_again and drop.startswith("IF OBJECT_ID")
+    assert insert.startswith("INSERT INTO [DIRaw]")
+    assert processor.rows_written == 3
+
+
+def test_process_zip_appends_per_chunk_by_default():
+    engine = RecordingEngine(mssql.dialect())
+    processor = _processor(engine, DBOptions())
+    written = []
+    processor._iter_zip_chunks = lambda zippath, read_opts: iter([[1, 2], [3]])
+
+    def fake_chunk(chunk, con, table_name):
+        written.append((con, table_name))
+        return len(chunk)
+
+    processor._process_chunk = fake_chunk
+    processor._process_zip("ovr.zip")
+
+    assert written == [(engine, "DIRaw")] * 2
+    assert engine.conn.statements == []
+    assert processor.rows_written == 3
+
+
+def test_unpicklable_engine_factory_falls_back_to_sequential(tmp_path):
+    for name in ("a.zip", "b.zip"):
+        (tmp_path / name).write_bytes(b"")
+    engine = RecordingEngine(sqlite.dialect())
+    processor = OVRProcessor(
+        DEFAULT_MAPPING,
+        engine_factory=lambda: engine,
+        pickup_path=str(tmp_path),
+        max_workers=2,
+    )
+    seen = []
+    processor._process_zip = seen.append
+
+    assert processor.process_all() == 2
+    assert seen == [str(tmp_path / "a.zip"), str(tmp_path / "b.zip")]
+
+
+def test_parallel_zips_write_all_rows(tmp_path):
+    pickup = tmp_path / "pickup"
+    pickup.mkdir()
+    for name in ("a.zip", "b.zip"):
+        shutil.copy(SAMPLE_ZIP, pickup / name)
+    url = f"sqlite:///{tmp_path / 'ovr.db'}"
+    factory = partial(create_engine, url, connect_args={"timeout": 30})
+    engine = factory()
+    # DIRaw exists in every deployment; creating it once avoids workers racing on CREATE
+    pd.DataFrame(columns=DEFAULT_MAPPING.target_order).to_sql(
+        "DIRaw", engine, index=False, dtype=SQL_DTYPE
+    )
+
+    processor = OVRProcessor(
+        DEFAULT_MAPPING,
+        engine_factory=factory,
+        pickup_path=str(pickup),
+        csv_batch_rows=300,
+        max_workers=2,
+    )
+    assert processor._worker_settings() is not None  # really takes the parallel branch
+    assert processor.process_all() == 2
+
+    with engine.connect() as conn:
+        count = conn.execute(text("SELECT COUNT(*) FROM DIRaw")).scalar()
+    engine.dispose()
+    assert processor.rows_written == count > 0